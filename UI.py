@@ -1,7 +1,30 @@
+import collections
 import data
 import random
+import time
 import tkinter as tk
 
+TIMER_REFRESH_MS = 250  # How often the timer label is refreshed while the input area has focus
+SENTENCE_POOL_SIZE = 64  # Number of sentence indices drawn from the corpus per batch
+
+
+def count_matches(typed, sentence):
+    """
+    Counts the positions at which the typed text matches the sentence.
+    Both are ASCII-encoded bytes, so each position is compared as a plain integer.
+    An error-free prefix is recognised without comparing position by position.
+
+    Args:
+        typed: The text the user has typed so far, as bytes.
+        sentence: The sentence the user is asked to type, as bytes.
+
+    Returns:
+        int: The number of matching characters.
+    """
+    if sentence.startswith(typed):  # Common case of no typos so far, checked with a single C-level memcmp
+        return len(typed)
+    return sum(map(int.__eq__, typed, sentence))
+
 
 class SentenceDisplay(tk.Frame):
     """
@@ -18,26 +41,37 @@ class SentenceDisplay(tk.Frame):
         """
         super().__init__(parent)
         self.parent = parent
-        self.sentence_list = data.sentences  # List of sentences from the data module
+        self._queue = collections.deque()  # Pre-drawn sentence indices still to be shown, refilled when used up
+        self.current_sentence = ""  # Sentence currently shown, kept on the Python side
+        self.current_sentence_bytes = b""  # The same sentence encoded for fast comparison
+        self.current_sentence_length = 0  # Length of the encoded sentence
         self.sentence_label = tk.Label(parent, font=("Arial", 20))  # Label to display the sentence
         self.sentence_label.grid(column=1, row=0, pady=30)
         self.display_sentence()  # Display a random sentence when initialized
 
-    def get_random_sentence(self):
+    def get_random_index(self):
         """
-        Returns a random sentence from the sentence list.
+        Returns the index of the next random sentence in the queue.
+        Indices are drawn in batches with a single `random.sample` call.
 
         Returns:
-            str: A randomly selected sentence from the list.
+            int: The index into the data module's sentence lists of a randomly selected sentence.
         """
-        return random.choice(self.sentence_list)
+        if not self._queue:  # Draw a fresh batch once every queued sentence has been shown
+            count = len(data.sentences)
+            self._queue.extend(random.sample(range(count), min(SENTENCE_POOL_SIZE, count)))
+        return self._queue.popleft()
 
     def display_sentence(self):
         """
         Displays a random sentence in the sentence label.
         """
-        sentence = self.get_random_sentence()
+        index = self.get_random_index()
+        sentence = data.sentences[index]
         self.sentence_label.config(text=sentence)
+        self.current_sentence = sentence  # Cache it so readers don't have to query the label
+        self.current_sentence_bytes = data.sentences_bytes[index]  # Precomputed in the data module
+        self.current_sentence_length = data.sentence_lengths[index]
 
     def get_sentence(self):
         """
@@ -46,7 +80,7 @@ class SentenceDisplay(tk.Frame):
         Returns:
             str: The text of the sentence currently displayed.
         """
-        return self.sentence_label.cget("text")
+        return self.current_sentence
 
 
 class TypingArea(tk.Frame):
@@ -70,114 +104,217 @@ class TypingArea(tk.Frame):
 
         # Timer-related attributes
         self.timer_running = False  # Flag to indicate if the timer is running
-        self.time_elapsed = 0  # Total time elapsed in seconds
-        self.timer_id = None  # ID of the scheduled timer event
-
-        # Typing input area
-        self.input_area = tk.Entry(self, width=30, font=("Arial", 20))  # Text entry for user input
+        self.time_elapsed = 0.0  # Total time elapsed in seconds
+        self.start_time = 0.0  # Monotonic timestamp the elapsed time is measured from
+        self.timer_id = None  # ID of the scheduled timer label refresh
+        self._shown_seconds = None  # Whole seconds currently shown on the timer label, None before the first refresh
+
+        # Mirror of the input area, updated incrementally as the user types
+        self._buf = bytearray()  # ASCII-encoded copy of the text typed so far
+        self._word_count = 0  # Number of words typed so far
+
+        # Typing input area, reporting every edit so the mirror never has to read the whole text back
+        record_edit = (self.register(self.record_edit), "%d", "%i", "%S")
+        self.input_area = tk.Entry(self, width=30, font=("Arial", 20),
+                                   validate="key", validatecommand=record_edit)  # Text entry for user input
         self.input_area.grid(column=1, row=1, pady=20)
-        self.input_area.bind("<KeyRelease>", self.check_accuracy)  # Bind key release event to check accuracy
         self.input_area.bind("<FocusIn>", self.start_timer)  # Bind focus event to start timer
+        self.input_area.bind("<FocusOut>", self.pause_refresh)  # Stop refreshing the timer label when focus leaves
 
-        # Labels for accuracy, timer, and WPM
-        self.accuracy_label = tk.Label(self, text="Accuracy: 100%", font=("Arial", 16))
+        # Labels for accuracy, timer, and WPM, backed by variables so their text is only pushed to Tk when it changes
+        self._label_texts = {}  # Last text set on each label variable, keyed by variable name
+        self._shown_pct = 100  # Whole-number accuracy currently shown on the accuracy label
+        self.accuracy_var = tk.StringVar(self, value="Accuracy: 100%")
+        self.accuracy_label = tk.Label(self, textvariable=self.accuracy_var, font=("Arial", 16))
         self.accuracy_label.grid(column=2, row=1, padx=20)
 
-        self.timer_label = tk.Label(self, text="Time: 0s", font=("Arial", 16))
+        self.timer_var = tk.StringVar(self, value="Time: 0s")
+        self.timer_label = tk.Label(self, textvariable=self.timer_var, font=("Arial", 16))
         self.timer_label.grid(column=2, row=0, padx=20)
 
-        self.wpm_label = tk.Label(self, text="WPM: 0.00", font=("Arial", 16))
+        self._shown_wpm = 0.0  # WPM, rounded to the displayed precision, currently shown on the WPM label
+        self.wpm_var = tk.StringVar(self, value="WPM: 0.00")
+        self.wpm_label = tk.Label(self, textvariable=self.wpm_var, font=("Arial", 16))
         self.wpm_label.grid(column=2, row=2, padx=20)
 
         # Restart button to reset the program
         self.restart_button = tk.Button(self, text="Restart", command=self.restart_program)
         self.restart_button.grid(column=1, row=3, pady=20)
 
+        # Key release handler, built as a closure so the per-event path only touches local names.
+        # Bursts of key releases (e.g. a held key) are coalesced into a single idle accuracy check.
+        after_idle = self.after_idle
+        check_accuracy = self.check_accuracy
+        check_pending = False
+
+        def run_check():
+            nonlocal check_pending
+            check_pending = False
+            check_accuracy()
+
+        def on_key(event):
+            nonlocal check_pending
+            if not check_pending:  # A check is already scheduled otherwise
+                check_pending = True
+                after_idle(run_check)
+
+        self._on_key = on_key
+        self.input_area.bind("<KeyRelease>", on_key)  # Bind key release event to check accuracy
+
+    def set_label_text(self, var, text):
+        """
+        Sets the text of a label variable, skipping the Tk call if the text has not changed.
+
+        Args:
+            var: The StringVar backing the label.
+            text: The text to display.
+        """
+        name = str(var)
+        if self._label_texts.get(name) != text:
+            self._label_texts[name] = text
+            var.set(text)
+
+    def record_edit(self, action, index, text):
+        """
+        Applies an edit of the input area to the input mirror and updates the word count.
+        A single character typed at the end is handled in constant time; any other
+        edit (backspace, paste, typing in the middle) falls back to a full recount.
+
+        Args:
+            action: "1" for an insertion, "0" for a deletion.
+            index: The position of the edit in the input area.
+            text: The text being inserted or deleted.
+
+        Returns:
+            bool: Always True, so the edit is accepted.
+        """
+        buf = self._buf
+        index = int(index)
+        if action == "1":
+            appended = index == len(buf)
+            buf[index:index] = text.encode("ascii", "replace")
+            if appended and len(text) == 1:
+                # A new word starts when a non-space follows a space or the start of the input
+                if not buf[-1:].isspace() and (len(buf) == 1 or buf[-2:-1].isspace()):
+                    self._word_count += 1
+            else:
+                self._word_count = len(buf.split())  # Rare path: recount from scratch
+        elif action == "0":
+            del buf[index:index + len(text)]
+            self._word_count = len(buf.split())
+        return True
+
     def check_accuracy(self, event=None):
         """
         Checks the user's input for accuracy compared to the displayed sentence.
-        Also calculates and updates the WPM and stops the timer if accuracy reaches 100%.
+        Accuracy is the share of the typed characters that match the sentence.
+        Also calculates and updates the WPM and stops the timer once the sentence is typed exactly.
 
         Args:
             event: The event that triggers this method (usually a key release event).
         """
-        input_text = self.input_area.get()  # Get the text the user has typed
-        sentence = self.sentence_display.get_sentence()  # Get the displayed sentence
+        if self.timer_running:  # Measure the elapsed time on demand rather than counting ticks
+            self.time_elapsed = time.monotonic() - self.start_time
 
-        correct_chars = 0
-        for i, char in enumerate(input_text):
-            if i < len(sentence) and char == sentence[i]:  # Compare each character
-                correct_chars += 1
+        input_bytes = self._buf  # The text the user has typed, as mirrored by `record_edit`
+        sentence_display = self.sentence_display
+        sentence = sentence_display.current_sentence_bytes  # Get the displayed sentence as bytes
+        sentence_length = sentence_display.current_sentence_length
 
-            # Calculate and display the accuracy
-            accuracy_score = (correct_chars / len(sentence)) * 100 if sentence else 0
-            self.accuracy_label.config(text=f"Accuracy: {accuracy_score:.2f}%")
+        correct_chars = count_matches(input_bytes, sentence)  # Count matching characters in a single pass
 
-            if accuracy_score == 100:  # Stop the timer and calculate WPM when accuracy reaches 100%
-                self.stop_timer()
-                self.calculate_wpm(input_text)
+        # Calculate the accuracy over the characters typed so far, and only redisplay it when it changes
+        input_length = len(input_bytes)
+        pct = correct_chars * 100 // input_length if input_length else 100
+        if pct != self._shown_pct:
+            self._shown_pct = pct
+            self.set_label_text(self.accuracy_var, "Accuracy: %d%%" % pct)
+
+        # Stop the timer once exactly the full sentence has been typed correctly
+        if sentence_length and input_length == sentence_length and correct_chars == sentence_length:
+            self.stop_timer()
 
         # Continuously calculate WPM as user types
-        self.calculate_wpm(input_text)
+        self.calculate_wpm()
 
     def start_timer(self, event=None):
         """
-        Starts the timer if it is not already running. The timer updates every second.
+        Starts the timer if it is not already running, resuming from the time already elapsed.
+        Also starts refreshing the timer label if it is not being refreshed yet.
 
         Args:
             event: The event that triggers this method (usually a focus event).
         """
         if not self.timer_running:  # Only start the timer if it is not running
             self.timer_running = True
-            self.update_timer()  # Start updating the timer
+            self.start_time = time.monotonic() - self.time_elapsed
+        if self.timer_id is None:  # Only one refresh loop at a time
+            self.update_timer()  # Start updating the timer label
 
     def update_timer(self):
         """
-        Updates the timer every second and recalculates the WPM.
-        Schedules the next update using `after`.
+        Refreshes the timer label from the monotonic clock, recalculating the WPM whenever the shown second changes.
+        Schedules the next refresh using `after` while the timer is running.
         """
         if self.timer_running:
-            self.time_elapsed += 1  # Increment elapsed time by 1 second
-            self.timer_label.config(text=f"Time Elapsed: {self.time_elapsed}s")  # Update timer label
+            self.time_elapsed = time.monotonic() - self.start_time
+            seconds = int(self.time_elapsed)
+            if seconds != self._shown_seconds:  # The label only changes once per second
+                self._shown_seconds = seconds
+                self.set_label_text(self.timer_var, "Time Elapsed: %ds" % seconds)  # Update timer label
 
-            # Recalculate WPM based on current input
-            input_text = self.input_area.get()
-            self.calculate_wpm(input_text)
+                # Let the WPM decay while the user is idle, once per second like the timer label
+                self.calculate_wpm()
 
-            # Schedule the next timer update after 1 second
-            self.timer_id = self.after(1000, self.update_timer)
+            # Schedule the next label refresh
+            self.timer_id = self.after(TIMER_REFRESH_MS, self.update_timer)
+        else:
+            self.timer_id = None
+
+    def pause_refresh(self, event=None):
+        """
+        Cancels the scheduled timer label refresh. The elapsed time keeps being measured.
+
+        Args:
+            event: The event that triggers this method (usually a focus out event).
+        """
+        if self.timer_id:  # Cancel any scheduled timer events
+            self.after_cancel(self.timer_id)
+            self.timer_id = None
 
     def stop_timer(self):
         """
         Stops the timer and cancels any scheduled timer updates.
         """
         if self.timer_running:  # Only stop the timer if it is running
+            self.time_elapsed = time.monotonic() - self.start_time
             self.timer_running = False
-        if self.timer_id:  # Cancel any scheduled timer events
-            self.after_cancel(self.timer_id)
+
+            # Show the final time so the timer label agrees with the final WPM
+            self._shown_seconds = int(self.time_elapsed)
+            self.set_label_text(self.timer_var, "Time Elapsed: %ds" % self._shown_seconds)
+        self.pause_refresh()
 
     def reset_timer(self):
         """
         Resets the timer to 0 and updates the timer label accordingly.
         """
-        self.timer_running = False
-        self.time_elapsed = 0
-        self.timer_label.config(text="Time: 0s")  # Reset the timer label
+        self.stop_timer()
+        self.time_elapsed = 0.0
+        self._shown_seconds = None
+        self.set_label_text(self.timer_var, "Time: 0s")  # Reset the timer label
 
-    def calculate_wpm(self, input_text):
+    def calculate_wpm(self):
         """
-        Calculates and updates the words per minute (WPM) based on the user's input and elapsed time.
-
-        Args:
-            input_text: The text that the user has typed so far.
+        Calculates and updates the words per minute (WPM) based on the words typed and elapsed time.
         """
         if self.time_elapsed > 0:  # Avoid division by zero
-            time_minutes = self.time_elapsed / 60  # Convert elapsed time to minutes
-            words = len(input_text.split())  # Count the number of words typed
-            wpm = (words / time_minutes)  # Calculate words per minute
-            self.wpm_label.config(text=f"WPM: {wpm:.2f}")  # Update the WPM label
+            wpm = round(self._word_count * 60.0 / self.time_elapsed, 2)  # Words per second scaled to words per minute
         else:
-            self.wpm_label.config(text="WPM: 0.00")  # If no time has elapsed, WPM is 0
+            wpm = 0.0  # If no time has elapsed, WPM is 0
+        if wpm != self._shown_wpm:  # Only redisplay the WPM when the shown value changes
+            self._shown_wpm = wpm
+            self.set_label_text(self.wpm_var, "WPM: %.2f" % wpm)  # Update the WPM label
 
     def restart_program(self):
         """
@@ -186,8 +323,10 @@ class TypingArea(tk.Frame):
         self.reset_timer()  # Reset the timer to 0
         self.input_area.delete(0, tk.END)  # Clear the input area
         self.sentence_display.display_sentence()  # Display a new random sentence
-        self.accuracy_label.config(text="Accuracy: 100%")  # Reset accuracy label
-        self.wpm_label.config(text="WPM: 0.00")  # Reset WPM label
-        self.start_timer()  # Restart the timer when the user starts typing again
-        self.input_area.bind("<KeyRelease>", self.check_accuracy)  # Rebind the key release event
-        self.input_area.focus_set()  # Focus on the input field to allow typing immediately
+        self._shown_pct = 100
+        self.set_label_text(self.accuracy_var, "Accuracy: 100%")  # Reset accuracy label
+        self._shown_wpm = 0.0
+        self.set_label_text(self.wpm_var, "WPM: 0.00")  # Reset WPM label
+        if self.focus_get() is self.input_area:  # No FocusIn will follow, so restart the timer directly
+            self.start_timer()
+        self.input_area.focus_set()  # Focus on the input field; gaining focus restarts the timer
@@ -27,4 +27,8 @@ sentences = [
     "There are 12 months in a year",
     "She has 3 cats and 2 dogs",
     "The price is $99.99",
-    "My phone number is 555-1234"]
\ No newline at end of file
+    "My phone number is 555-1234"]
+
+# Parallel per-sentence data, precomputed once so it doesn't have to be derived on every keystroke
+sentences_bytes = [sentence.encode("ascii", "replace") for sentence in sentences]
+sentence_lengths = [len(sentence) for sentence in sentences_bytes]